@@ -19,11 +19,132 @@ Funcionalidades principais:
 """
 
 import streamlit as st
-import random
+import numpy as np
 from datetime import datetime
-from typing import List, Dict, Optional, Set
-from collections import Counter
+from typing import List, Optional, Set, Iterable, Iterator, Sequence, Tuple
 import re
+import math
+from itertools import combinations, count
+
+from nucleo_compilado import NUMBA_DISPONIVEL, sortear_aceitos
+
+
+# Máscaras de bits pré-calculadas: o bit n representa o número n (1 a 60).
+MASCARA_BAIXOS = sum(1 << n for n in range(1, 31))
+MASCARA_ALTOS = sum(1 << n for n in range(31, 61))
+MASCARA_NUMEROS = MASCARA_BAIXOS | MASCARA_ALTOS
+
+# Quantidade de candidatos sorteados e validados de uma só vez pelo NumPy:
+# cerca de 2 candidatos por jogo que falta, entre estes dois limites.
+TAMANHO_LOTE = 1024
+TAMANHO_LOTE_MAXIMO = 4096
+
+# Maior multiplicador oferecido: os jogos são gerados uma vez para ele e cada
+# multiplicador menor usa só o começo dessas listas.
+MULTIPLICADOR_MAXIMO = 5
+
+# Entradas mantidas por cada cache do Streamlit. Cada texto colado e cada
+# semente de sessão criam entradas novas; sem limite os caches cresceriam
+# enquanto o servidor roda.
+MAX_ENTRADAS_CACHE = 32
+
+# Até C(11, 6) = 462 combinações, enumerar as válidas custa o mesmo que sortear
+# e evita gastar todas as tentativas quando a base quase se esgota. Acima disso
+# o sorteio por rejeição é mais rápido.
+LIMITE_ENUMERACAO = 500
+
+# Representação com dois dígitos de cada número, usada na exibição e no arquivo.
+_NUMEROS_FORMATADOS = tuple(f"{n:02}" for n in range(100))
+# A mesma representação em bytes, seguida de um espaço, para formatar lotes inteiros.
+_BYTES_FORMATADOS = np.frombuffer(
+    "".join(f"{n:02} " for n in range(100)).encode(), dtype=np.uint8
+).reshape(100, 3)
+
+# Uma linha de entrada: "01 02 03 04 05 06 (Nome)". `[^\S\n]` é qualquer
+# espaço em branco exceto quebra de linha, para que um jogo não atravesse linhas.
+_PADRAO_LINHA = re.compile(
+    r"^[^\S\n]*((?:\d{2}[^\S\n]){5}\d{2})[^\S\n]*\(([^)\n]*)\)", re.MULTILINE
+)
+
+
+def mascara_de(numeros: Iterable[int]) -> int:
+    """
+    Converte uma coleção de números em uma máscara de bits.
+
+    Args:
+        numeros (Iterable[int]): Números a serem representados
+
+    Returns:
+        int: Inteiro com o bit n ligado para cada número n da coleção
+    """
+    mascara = 0
+    for n in numeros:
+        mascara |= 1 << n
+    return mascara
+
+
+def formatar_numeros(numeros: Iterable[int]) -> str:
+    """
+    Formata números com dois dígitos separados por espaço, ex.: "03 08 11 14 16 29".
+
+    Args:
+        numeros (Iterable[int]): Números do jogo, em ordem crescente
+
+    Returns:
+        str: Números formatados
+    """
+    return " ".join([_NUMEROS_FORMATADOS[n] for n in numeros])
+
+
+def formatar_combinacoes(combinacoes: np.ndarray) -> str:
+    """
+    Formata uma matriz de combinações com uma linha por jogo, como `formatar_numeros`.
+
+    Cada linha é montada de uma só vez em uma matriz de bytes: 18 caracteres
+    por jogo, com o último espaço trocado pela quebra de linha.
+
+    Args:
+        combinacoes (np.ndarray): Matriz (N, 6) com um jogo por linha
+
+    Returns:
+        str: Jogos formatados, separados por quebras de linha
+    """
+    linhas = _BYTES_FORMATADOS[combinacoes].reshape(len(combinacoes), 18)
+    linhas[:, 17] = ord("\n")
+    return linhas.tobytes().decode()[:-1]
+
+
+def numeros_de(mascara: int) -> List[int]:
+    """
+    Converte uma máscara de bits de volta na lista ordenada de números.
+
+    Args:
+        mascara (int): Máscara com o bit n ligado para cada número n
+
+    Returns:
+        List[int]: Números representados pela máscara, em ordem crescente
+    """
+    numeros = []
+    while mascara:
+        bit = mascara & -mascara
+        numeros.append(bit.bit_length() - 1)
+        mascara ^= bit
+    return numeros
+
+
+@st.cache_resource
+def _contador_ids() -> Iterator[int]:
+    """
+    Cria o contador dos identificadores dos jogos.
+
+    O Streamlit reexecuta o script a cada interação, o que faria um contador
+    comum voltar a 1. Em `st.cache_resource` o mesmo contador é reaproveitado
+    por todas as execuções e sessões do servidor.
+    """
+    return count(1)
+
+
+_CONTADOR_IDS = _contador_ids()
 
 
 class Jogo:
@@ -31,35 +152,59 @@ class Jogo:
     Classe que representa um jogo da Mega-Sena.
 
     Esta classe mantém as informações de um jogo individual, incluindo os números
-    escolhidos, identificador único, nome do apostador e metadados adicionais.
+    escolhidos, identificador e nome do apostador.
     Implementa as funções necessárias para comparação e uso em estruturas de dados.
 
+    O `id` vem de um contador e segue a ordem de criação dos jogos; ele não se
+    repete dentro do processo do servidor. O `timestamp` é criado apenas no
+    primeiro acesso, pois a maior parte dos jogos gerados nunca o utiliza.
+
     Atributos:
-        id (str): Identificador único do jogo (timestamp + número aleatório)
+        id (int): Identificador do jogo, na ordem de criação
         nome (str): Nome do apostador (limitado a 50 caracteres)
-        numeros (List[int]): Lista ordenada com os 6 números do jogo
-        timestamp (datetime): Data e hora da criação do jogo
-        metadata (Dict): Dicionário com metadados adicionais do jogo
-        metricas (Dict): Dicionário com métricas calculadas do jogo
+        numeros (bytes): Os 6 números do jogo em ordem crescente, um byte por número
+        mascara (int): Máscara de bits dos números, usada em validações e unicidade
+        timestamp (datetime): Data e hora do primeiro acesso ao jogo
     """
 
-    def __init__(self, numeros: List[int], nome: str = "", metadata: Dict = None):
-        self.id = f"{datetime.now().timestamp()}-{random.randint(1000, 9999)}"
+    __slots__ = ("id", "nome", "numeros", "mascara", "_timestamp", "_formatado")
+
+    def __init__(self, numeros: List[int], nome: str = "", ordenados: bool = False):
+        self.id = next(_CONTADOR_IDS)
         self.nome = nome[:50].strip()
-        self.numeros = sorted(numeros)
-        self.timestamp = datetime.now()
-        self.metadata = metadata or {}
-        self.metricas = {}
+        # Quem já tem os números em ordem crescente pode dispensar a ordenação.
+        self.numeros = bytes(numeros if ordenados else sorted(numeros))
+        self.mascara = mascara_de(self.numeros)
+        self._timestamp = None
+        self._formatado = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Data e hora registradas no primeiro acesso."""
+        if self._timestamp is None:
+            self._timestamp = datetime.now()
+        return self._timestamp
+
+    @property
+    def formatado(self) -> str:
+        """Números do jogo formatados por `formatar_numeros`."""
+        if self._formatado is None:
+            self._formatado = formatar_numeros(self.numeros)
+        return self._formatado
 
     def __hash__(self):
-        """Permite uso do objeto em sets e como chave em dicionários."""
-        return hash(tuple(self.numeros))
+        """
+        Permite uso do objeto em sets e como chave em dicionários.
+
+        A máscara, calculada uma única vez no construtor, já é o hash: como
+        ela é menor que 2**61 - 1, o hash de int a devolve sem alterações, e
+        dois jogos só têm o mesmo hash quando têm os mesmos números.
+        """
+        return self.mascara
 
     def __eq__(self, other):
         """Define quando dois jogos são considerados iguais."""
-        if not isinstance(other, Jogo):
-            return False
-        return set(self.numeros) == set(other.numeros)
+        return isinstance(other, Jogo) and self.mascara == other.mascara
 
     def validar(self):
         """
@@ -70,9 +215,9 @@ class Jogo:
         """
         if len(self.numeros) != 6:
             raise ValueError("Um jogo deve conter exatamente 6 números.")
-        if not all(1 <= n <= 60 for n in self.numeros):
+        if self.mascara & ~MASCARA_NUMEROS:
             raise ValueError("Todos os números devem estar no intervalo de 1 a 60.")
-        if len(set(self.numeros)) != 6:
+        if self.mascara.bit_count() != 6:
             raise ValueError("Os números de um jogo não podem se repetir.")
 
 
@@ -81,14 +226,18 @@ class GeradorJogos:
     Classe para gerenciar a geração de jogos únicos.
 
     Esta classe mantém controle de todos os jogos gerados e fornece métodos
-    para garantir a unicidade das combinações.
+    para garantir a unicidade das combinações. Os jogos são registrados pela
+    sua máscara de bits, o que reduz a verificação de duplicatas a uma busca
+    de inteiro em um conjunto.
 
     Attributes:
-        jogos_gerados (Set[Jogo]): Conjunto de todos os jogos já gerados
+        jogos_gerados (Set[int]): Máscaras de todos os jogos já gerados
+        rng (np.random.Generator): Gerador de números aleatórios dos sorteios em lote
     """
 
-    def __init__(self):
-        self.jogos_gerados: Set[Jogo] = set()
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        self.jogos_gerados: Set[int] = set()
+        self.rng = rng if rng is not None else np.random.default_rng()
 
     def adicionar_jogo(self, jogo: Jogo) -> bool:
         """
@@ -100,65 +249,299 @@ class GeradorJogos:
         Returns:
             bool: True se o jogo foi adicionado, False se já existia
         """
-        if jogo in self.jogos_gerados:
+        if jogo.mascara in self.jogos_gerados:
             return False
-        self.jogos_gerados.add(jogo)
+        self.jogos_gerados.add(jogo.mascara)
         return True
 
-    def gerar_combinacao_unica(
-        self, 
-        numeros_disponiveis: List[int], 
-        tamanho: int = 6, 
-        max_tentativas: int = 1000
-    ) -> Optional[Jogo]:
+    def gerar_combinacoes_unicas(
+        self,
+        numeros_base: Sequence[int],
+        quantidade: int,
+        numeros_novos: Sequence[int] = (),
+        minimo_base: int = 6,
+        maximo_base: int = 6,
+        max_lotes: int = 50,
+    ) -> np.ndarray:
         """
-        Gera uma combinação única de números.
-        
+        Gera várias combinações únicas sorteando e validando candidatos em lote.
+
+        Cada candidato recebe entre `minimo_base` e `maximo_base` números de
+        `numeros_base` e completa os 6 números com `numeros_novos`. Com o Numba
+        instalado o sorteio roda em código compilado; sem ele, lotes de
+        candidatos são sorteados e validados de forma vetorizada pelo NumPy,
+        em lotes proporcionais ao que ainda falta gerar.
+
+        As combinações são devolvidas como uma única matriz, uma linha por
+        jogo, sem criar um objeto Jogo para cada uma.
+
         Args:
-            numeros_disponiveis (List[int]): Lista de números disponíveis para sorteio
-            tamanho (int): Quantidade de números em cada combinação
-            max_tentativas (int): Número máximo de tentativas antes de desistir
+            numeros_base (Sequence[int]): Números sorteados para a base do jogo
+            quantidade (int): Quantidade de combinações desejadas
+            numeros_novos (Sequence[int]): Números usados para completar o jogo
+            minimo_base (int): Mínimo de números retirados da base
+            maximo_base (int): Máximo de números retirados da base
+            max_lotes (int): Número máximo de lotes sorteados antes de desistir
 
         Returns:
-            Optional[Jogo]: Novo jogo único ou None se não for possível gerar
+            np.ndarray: Matriz (N, 6) int8 com uma combinação ordenada por linha
+            (N pode ser menor que `quantidade`)
+        """
+        if quantidade <= 0:
+            return np.empty((0, 6), dtype=np.int8)
+
+        base = np.asarray(numeros_base, dtype=np.int8)
+        novos = np.asarray(numeros_novos, dtype=np.int8)
+        minimo_base = max(minimo_base, 6 - len(novos))
+        maximo_base = min(maximo_base, len(base))
+
+        if minimo_base > maximo_base:
+            return np.empty((0, 6), dtype=np.int8)
+        if minimo_base == 6 and math.comb(len(np.unique(base)), 6) <= LIMITE_ENUMERACAO:
+            return self._gerar_por_enumeracao(base, quantidade)
+
+        # Sem números novos, a base é dividida em baixos e altos e cada jogo
+        # recebe k baixos e 6 - k altos, com k entre 2 e 4: a regra de
+        # baixos/altos deixa de ser um motivo de rejeição.
+        if minimo_base == 6:
+            base, novos = base[base <= 30], base[base > 30]
+            minimo_base = max(2, 6 - len(novos))
+            maximo_base = min(4, len(base))
+            if minimo_base > maximo_base:
+                return np.empty((0, 6), dtype=np.int8)
+            # Pesar k por C(baixos, k) * C(altos, 6 - k) mantém o sorteio
+            # uniforme entre as combinações da base, como na rejeição.
+            pesos = np.array([
+                math.comb(len(base), k) * math.comb(len(novos), 6 - k)
+                for k in range(minimo_base, maximo_base + 1)
+            ], dtype=np.float64)
+        else:
+            pesos = np.ones(maximo_base - minimo_base + 1)
+
+        # Quantidades da base que nunca formam um jogo válido só gerariam
+        # rejeições; zerar seus pesos não muda a distribuição dos aceitos.
+        pesos *= _quantidades_viaveis(base, novos, minimo_base, maximo_base)
+        if not pesos.any():
+            return np.empty((0, 6), dtype=np.int8)
+        pesos /= pesos.sum()
+
+        if NUMBA_DISPONIVEL:
+            return self._gerar_compilado(
+                base, novos, minimo_base, maximo_base, pesos, quantidade,
+                max_lotes * max(2 * quantidade, TAMANHO_LOTE),
+            )
+        return self._gerar_em_lotes(base, novos, minimo_base, maximo_base, pesos, quantidade, max_lotes)
+
+    def _gerar_por_enumeracao(self, base: np.ndarray, quantidade: int) -> np.ndarray:
+        """
+        Sorteia as combinações entre todas as combinações válidas da base.
+
+        Cada combinação recebe como peso o produto das repetições de seus
+        números na base, reproduzindo a mesma distribuição do sorteio por
+        rejeição, mas sem tentativas descartadas.
         """
-        tentativas = 0
-        while tentativas < max_tentativas:
-            combinacao = sorted(random.sample(numeros_disponiveis, tamanho))
-            jogo = Jogo(numeros=combinacao)
-            try:
-                validar_distribuicao(jogo)
-                if self.adicionar_jogo(jogo):
-                    return jogo
-            except ValueError:
-                pass
-            tentativas += 1
-        return None
+        numeros, repeticoes = np.unique(base, return_counts=True)
+        combinacoes, mascaras = _combinacoes_validas(tuple(numeros.tolist()))
+
+        vistos = np.fromiter(self.jogos_gerados, dtype=np.int64, count=len(self.jogos_gerados))
+        livres = np.flatnonzero(~np.isin(mascaras, vistos))
+        quantidade = min(quantidade, len(livres))
+        if quantidade <= 0:
+            return np.empty((0, 6), dtype=np.int8)
+
+        pesos_numeros = np.zeros(61)
+        pesos_numeros[numeros] = repeticoes
+        pesos = pesos_numeros[combinacoes[livres]].prod(axis=1)
+        escolhidos = self.rng.choice(livres, size=quantidade, replace=False, p=pesos / pesos.sum())
+
+        self.jogos_gerados.update(mascaras[escolhidos].tolist())
+        return combinacoes[escolhidos]
+
+    def _gerar_compilado(
+        self,
+        base: np.ndarray,
+        novos: np.ndarray,
+        minimo_base: int,
+        maximo_base: int,
+        pesos: np.ndarray,
+        quantidade: int,
+        max_tentativas: int,
+    ) -> np.ndarray:
+        """Gera as combinações com o núcleo compilado pelo Numba."""
+        vistos = np.fromiter(self.jogos_gerados, dtype=np.int64, count=len(self.jogos_gerados))
+        semente = int(self.rng.integers(2**31))
+        aceitos, mascaras = sortear_aceitos(
+            base, novos, minimo_base, maximo_base, np.cumsum(pesos), quantidade,
+            vistos, semente, max_tentativas,
+        )
+        self.jogos_gerados.update(mascaras.tolist())
+        return aceitos
+
+    def _gerar_em_lotes(
+        self,
+        base: np.ndarray,
+        novos: np.ndarray,
+        minimo_base: int,
+        maximo_base: int,
+        pesos: np.ndarray,
+        quantidade: int,
+        max_lotes: int,
+    ) -> np.ndarray:
+        """Gera as combinações sorteando e validando lotes com o NumPy."""
+        # A consulta a um set de inteiros já é a verificação mais barata por
+        # candidato em Python; apenas evitamos as buscas de atributo no laço.
+        gerados = self.jogos_gerados
+        registrar = gerados.add
+
+        # Com reposição, quanto mais números saem de um mesmo grupo, maior a
+        # chance de repetição. Multiplicar cada peso por L**k / (L)_k mantém
+        # a mesma distribuição do sorteio sem reposição.
+        pesos = pesos * np.array([
+            len(base) ** k / math.perm(len(base), k)
+            * len(novos) ** (6 - k) / math.perm(len(novos), 6 - k)
+            for k in range(minimo_base, maximo_base + 1)
+        ])
+        pesos /= pesos.sum()
+        partes = []
+        total = 0
+        lotes = 0
+        while total < quantidade and lotes < max_lotes:
+            linhas = min(max(2 * (quantidade - total), TAMANHO_LOTE), TAMANHO_LOTE_MAXIMO)
+            candidatos = np.sort(
+                _sortear_lote(self.rng, base, novos, minimo_base, maximo_base, pesos, linhas),
+                axis=1,
+            )
+            aceitos = candidatos[_filtrar_lote(candidatos)]
+            ineditos = []
+            for i, mascara in enumerate(_mascaras_lote(aceitos).tolist()):
+                if mascara in gerados:
+                    continue
+                registrar(mascara)
+                ineditos.append(i)
+                total += 1
+                if total == quantidade:
+                    break
+            partes.append(aceitos[ineditos])
+            lotes += 1
+        return np.concatenate(partes) if partes else np.empty((0, 6), dtype=np.int8)
+
+
+def _quantidades_viaveis(
+    base: np.ndarray, novos: np.ndarray, minimo_base: int, maximo_base: int
+) -> np.ndarray:
+    """
+    Indica, para cada k de `minimo_base` a `maximo_base`, se algum jogo com k
+    números distintos da base e 6 - k novos pode ter de 2 a 4 números baixos.
+
+    Returns:
+        np.ndarray: Vetor booleano, uma posição por valor de k
+    """
+    # As máscaras contam os números distintos de cada parte sem ordenar nada.
+    mascara_base = _mascara_vetor(base)
+    mascara_novos = _mascara_vetor(novos)
+    baixos_base = (mascara_base & MASCARA_BAIXOS).bit_count()
+    baixos_novos = (mascara_novos & MASCARA_BAIXOS).bit_count()
+    altos_base = (mascara_base & MASCARA_ALTOS).bit_count()
+    altos_novos = (mascara_novos & MASCARA_ALTOS).bit_count()
+
+    viaveis = []
+    for k in range(minimo_base, maximo_base + 1):
+        # Faixa de baixos possível em cada parte do jogo.
+        menor = max(0, k - altos_base) + max(0, 6 - k - altos_novos)
+        maior = min(k, baixos_base) + min(6 - k, baixos_novos)
+        viaveis.append(
+            k <= baixos_base + altos_base
+            and 6 - k <= baixos_novos + altos_novos
+            and max(menor, 2) <= min(maior, 4)
+        )
+    return np.array(viaveis)
+
+
+def _sortear_lote(
+    rng: np.random.Generator,
+    base: np.ndarray,
+    novos: np.ndarray,
+    minimo_base: int,
+    maximo_base: int,
+    pesos: np.ndarray,
+    linhas: int,
+) -> np.ndarray:
+    """
+    Sorteia um lote de candidatos com 6 números cada.
+
+    Cada linha usa entre `minimo_base` e `maximo_base` números da base, com
+    as probabilidades de `pesos`, e completa o jogo com números novos.
+
+    Os números são sorteados com reposição, por índice: números repetidos na
+    base pesam pelas suas repetições sem varrer a base a cada linha, e as
+    linhas com números repetidos são descartadas por `_filtrar_lote`.
+
+    Returns:
+        np.ndarray: Matriz (linhas, 6) de candidatos, ainda não ordenados
+    """
+    sorteio = base[rng.integers(len(base), size=(linhas, maximo_base))]
+    if minimo_base < 6:
+        complemento = novos[rng.integers(len(novos), size=(linhas, 6 - minimo_base))]
+        sorteio = np.concatenate([sorteio, complemento], axis=1)
+    if minimo_base == maximo_base:
+        return sorteio
+
+    # Colunas j < k vêm da base; as demais vêm do complemento.
+    k = minimo_base + rng.choice(len(pesos), size=(linhas, 1), p=pesos)
+    colunas = np.arange(6)
+    indices = np.where(colunas < k, colunas, maximo_base + colunas - k)
+    return np.take_along_axis(sorteio, indices, axis=1)
 
 
-def validar_distribuicao(jogo: Jogo):
+def _filtrar_lote(candidatos: np.ndarray) -> np.ndarray:
     """
-    Valida a distribuição dos números em um jogo seguindo regras específicas.
+    Aplica as regras de distribuição a um lote de candidatos ordenados.
+
+    Como cada linha está ordenada, uma sequência de 4 números da mesma dezena
+    aparece como `dezenas[:, i] == dezenas[:, i + 3]`, e o mesmo vale para 3
+    terminações iguais depois de ordenar as terminações.
 
     Args:
-        jogo (Jogo): Objeto Jogo a ser validado
+        candidatos (np.ndarray): Matriz (N, 6) com cada linha em ordem crescente
 
-    Raises:
-        ValueError: Se alguma regra de distribuição for violada
+    Returns:
+        np.ndarray: Vetor booleano indicando os candidatos válidos
     """
-    baixos = [n for n in jogo.numeros if 1 <= n <= 30]
-    altos = [n for n in jogo.numeros if 31 <= n <= 60]
+    baixos = (candidatos <= 30).sum(axis=1)
+    dezenas = candidatos // 10
+    terminacoes = np.sort(candidatos % 10, axis=1)
+    return (
+        (candidatos[:, 1:] != candidatos[:, :-1]).all(axis=1)
+        & (baixos >= 2)
+        & (baixos <= 4)
+        & (dezenas[:, 3:] != dezenas[:, :-3]).all(axis=1)
+        & (terminacoes[:, 2:] != terminacoes[:, :-2]).all(axis=1)
+    )
+
 
-    if not (2 <= len(baixos) <= 4 and 2 <= len(altos) <= 4):
-        raise ValueError("Jogo deve conter entre 2-4 números baixos e 2-4 números altos.")
+def _mascaras_lote(candidatos: np.ndarray) -> np.ndarray:
+    """Calcula a máscara de bits de cada linha de um lote de candidatos."""
+    return (np.int64(1) << candidatos.astype(np.int64)).sum(axis=1)
 
-    dezenas = Counter(n // 10 for n in jogo.numeros)
-    if max(dezenas.values()) > 3:
-        raise ValueError("Jogo não pode ter mais de 3 números da mesma dezena.")
 
-    terminacoes = Counter(n % 10 for n in jogo.numeros)
-    if max(terminacoes.values()) > 2:
-        raise ValueError("Jogo não pode ter mais de 2 números com a mesma terminação.")
+def _mascara_vetor(numeros: np.ndarray) -> int:
+    """Calcula a máscara de bits de um vetor de números, com ou sem repetições."""
+    return int(np.bitwise_or.reduce(np.int64(1) << numeros.astype(np.int64)))
+
+
+def _combinacoes_validas(numeros: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Enumera as combinações de 6 números que respeitam as regras de distribuição.
+
+    Args:
+        numeros (Tuple[int, ...]): Números distintos, em ordem crescente
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Combinações válidas (N, 6) e suas máscaras
+    """
+    todas = np.array(list(combinations(numeros, 6)), dtype=np.int8).reshape(-1, 6)
+    validas = todas[_filtrar_lote(todas)]
+    return validas, _mascaras_lote(validas)
 
 
 def gerar_combinacoes_tipo_a(jogos_referencia: List[Jogo], gerador: GeradorJogos) -> List[Jogo]:
@@ -178,79 +561,63 @@ def gerar_combinacoes_tipo_a(jogos_referencia: List[Jogo], gerador: GeradorJogos
 
 
 def gerar_combinacoes_tipo_b(
-    jogos_referencia: List[Jogo], 
+    numeros_referencia: Sequence[int],
     num_combinacoes: int, 
     gerador: GeradorJogos
-) -> List[Jogo]:
+) -> np.ndarray:
     """
     Gera combinações tipo B garantindo unicidade.
 
     Args:
-        jogos_referencia (List[Jogo]): Lista de jogos originais
+        numeros_referencia (Sequence[int]): Números de todos os jogos originais
         num_combinacoes (int): Quantidade de novas combinações a serem geradas
         gerador (GeradorJogos): Instância do gerador para controle de unicidade
 
     Returns:
-        List[Jogo]: Lista com as novas combinações geradas
+        np.ndarray: Matriz (N, 6) com uma nova combinação por linha
+        (N pode ser menor que `num_combinacoes`)
     """
-    combinacoes = []
-    numeros_referencia = [n for jogo in jogos_referencia for n in jogo.numeros]
-    
-    while len(combinacoes) < num_combinacoes:
-        jogo = gerador.gerar_combinacao_unica(numeros_referencia)
-        if jogo:
-            combinacoes.append(jogo)
-        else:
-            st.warning(f"⚠️ Não foi possível gerar mais combinações únicas do tipo B. Geradas {len(combinacoes)} de {num_combinacoes}.")
-            break
-    
-    return combinacoes
+    return gerador.gerar_combinacoes_unicas(numeros_referencia, num_combinacoes)
 
 
 def gerar_combinacoes_tipo_c(
-    jogos_referencia: List[Jogo], 
+    numeros_referencia: Sequence[int],
+    numeros_novos: Sequence[int],
     num_combinacoes: int, 
     gerador: GeradorJogos
-) -> List[Jogo]:
+) -> np.ndarray:
     """
     Gera combinações tipo C garantindo unicidade.
 
     Args:
-        jogos_referencia (List[Jogo]): Lista de jogos originais
+        numeros_referencia (Sequence[int]): Números de todos os jogos originais
+        numeros_novos (Sequence[int]): Números que não aparecem nos jogos originais
         num_combinacoes (int): Quantidade de novas combinações a serem geradas
         gerador (GeradorJogos): Instância do gerador para controle de unicidade
 
     Returns:
-        List[Jogo]: Lista com as novas combinações geradas
+        np.ndarray: Matriz (N, 6) com uma nova combinação por linha
+        (N pode ser menor que `num_combinacoes`)
     """
-    combinacoes = []
-    numeros_referencia = [n for jogo in jogos_referencia for n in jogo.numeros]
-    todos_numeros = set(range(1, 61))
-    numeros_novos = list(todos_numeros - set(numeros_referencia))
-    
-    while len(combinacoes) < num_combinacoes:
-        base = random.sample(numeros_referencia, random.randint(1, 2))
-        novos = random.sample(numeros_novos, 6 - len(base))
-        jogo = Jogo(numeros=sorted(base + novos))
-        
-        try:
-            validar_distribuicao(jogo)
-            if gerador.adicionar_jogo(jogo):
-                combinacoes.append(jogo)
-        except ValueError:
-            continue
-            
-        if len(combinacoes) < num_combinacoes and not novos:
-            st.warning(f"⚠️ Não foi possível gerar mais combinações únicas do tipo C. Geradas {len(combinacoes)} de {num_combinacoes}.")
-            break
-    
-    return combinacoes
+    # Cada jogo combina 1-2 números de referência com números novos.
+    return gerador.gerar_combinacoes_unicas(
+        numeros_referencia,
+        num_combinacoes,
+        numeros_novos=numeros_novos,
+        minimo_base=1,
+        maximo_base=2,
+    )
 
 
+@st.cache_data(show_spinner=False, max_entries=MAX_ENTRADAS_CACHE)
 def processar_dados_entrada(conteudo: str) -> List[Jogo]:
     """
     Processa dados de entrada em formato texto para criar objetos Jogo.
 
+    O resultado fica em cache do Streamlit, indexado pelo texto colado: processar
+    de novo o mesmo conteúdo não repete a leitura e a validação dos jogos. Erros
+    não são guardados em cache e voltam a ser levantados a cada chamada.
+
     O formato esperado é:
     01 02 03 04 05 06 (Nome)
     07 08 09 10 11 12 (Outro Nome)
@@ -265,18 +632,124 @@ def processar_dados_entrada(conteudo: str) -> List[Jogo]:
         ValueError: Se algum jogo não estiver no formato correto
     """
     jogos = []
-    linhas = conteudo.strip().split("\n")
-    for linha in linhas:
-        match = re.match(r"((?:\d{2}\s){5}\d{2})\s*\((.*?)\)", linha)
-        if match:
-            numeros = list(map(int, match.group(1).split()))
-            nome = match.group(2)
-            jogo = Jogo(numeros=numeros, nome=nome)
+    for match in _PADRAO_LINHA.finditer(conteudo):
+        # O padrão já garante seis campos de dois dígitos; `split` e `map`
+        # convertem todos em C, mais rápido que fatiar cada posição.
+        numeros = list(map(int, match.group(1).split()))
+        jogo = Jogo(numeros=numeros, nome=match.group(2))
+        # Com seis números garantidos pelo padrão, basta a máscara para saber
+        # se o jogo é válido; `validar` só é chamado para montar a mensagem.
+        mascara = jogo.mascara
+        if mascara & ~MASCARA_NUMEROS or mascara.bit_count() != 6:
             jogo.validar()
-            jogos.append(jogo)
+        jogos.append(jogo)
     return jogos
 
 
+def quantidades_por_tipo(num_referencias: int, multiplicador: int) -> Tuple[int, int]:
+    """
+    Calcula quantos jogos tipo B e tipo C completam o total pedido.
+
+    Args:
+        num_referencias (int): Quantidade de jogos originais
+        multiplicador (int): Multiplicador escolhido
+
+    Returns:
+        Tuple[int, int]: Quantidades de jogos tipo B e tipo C
+    """
+    total_jogos = num_referencias * multiplicador
+    # Com multiplicador 1x os 75% não cobrem nem os originais: nada a gerar
+    num_jogos_b = max(int(total_jogos * 0.75) - num_referencias, 0)
+    return num_jogos_b, total_jogos - num_referencias - num_jogos_b
+
+
+@st.cache_data(show_spinner=False, max_entries=MAX_ENTRADAS_CACHE)
+def gerar_todas_combinacoes(
+    jogos_referencia: Tuple[Tuple[int, ...], ...],
+    semente: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gera os jogos tipo B e tipo C para o maior multiplicador.
+
+    As quantidades de cada tipo crescem com o multiplicador, então os jogos de
+    qualquer multiplicador menor são o começo destas listas. O resultado fica
+    em cache do Streamlit, indexado pelos jogos de referência e pela semente:
+    trocar de multiplicador não gera nada de novo.
+
+    Args:
+        jogos_referencia (Tuple[Tuple[int, ...], ...]): Números de cada jogo original
+        semente (int): Semente que torna a geração reprodutível
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Matrizes (N, 6) dos jogos tipo B e tipo C
+    """
+    num_jogos_b, num_jogos_c = quantidades_por_tipo(len(jogos_referencia), MULTIPLICADOR_MAXIMO)
+    gerador = GeradorJogos(np.random.default_rng(semente))  # Instância única do gerador
+    # Os números vêm de `Jogo.numeros`, já em ordem crescente.
+    referencias = [Jogo(numeros=numeros, ordenados=True) for numeros in jogos_referencia]
+
+    # Números de referência e números novos, calculados uma única vez e já
+    # como vetores int8, o formato usado pelos sorteios em lote
+    numeros_referencia = np.array(jogos_referencia, dtype=np.int8).reshape(-1)
+    mascara_referencia = 0
+    for jogo in referencias:
+        mascara_referencia |= jogo.mascara
+    numeros_novos = np.array(numeros_de(MASCARA_NUMEROS & ~mascara_referencia), dtype=np.int8)
+
+    # Gera as combinações usando o mesmo gerador para garantir unicidade global
+    gerar_combinacoes_tipo_a(referencias, gerador)
+    combinacoes_b = gerar_combinacoes_tipo_b(numeros_referencia, num_jogos_b, gerador)
+    combinacoes_c = gerar_combinacoes_tipo_c(numeros_referencia, numeros_novos, num_jogos_c, gerador)
+    return combinacoes_b, combinacoes_c
+
+
+@st.cache_data(show_spinner=False, max_entries=MAX_ENTRADAS_CACHE)
+def selecionar_combinacoes(
+    jogos_referencia: Tuple[Tuple[int, ...], ...],
+    multiplicador: int,
+    semente: int,
+) -> Tuple[np.ndarray, np.ndarray, str]:
+    """
+    Separa os jogos tipo B e tipo C de um multiplicador e monta o arquivo.
+
+    Args:
+        jogos_referencia (Tuple[Tuple[int, ...], ...]): Números de cada jogo original
+        multiplicador (int): Multiplicador escolhido, até `MULTIPLICADOR_MAXIMO`
+        semente (int): Semente que torna a geração reprodutível
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, str]: Matrizes (N, 6) dos jogos tipo B e
+        tipo C e o conteúdo do arquivo para download
+    """
+    num_jogos_b, num_jogos_c = quantidades_por_tipo(len(jogos_referencia), multiplicador)
+    todas_b, todas_c = gerar_todas_combinacoes(jogos_referencia, semente)
+    combinacoes_b = todas_b[:num_jogos_b]
+    combinacoes_c = todas_c[:num_jogos_c]
+
+    linhas = [formatar_numeros(numeros) for numeros in jogos_referencia]
+    if len(combinacoes_b) or len(combinacoes_c):
+        linhas.append(formatar_combinacoes(np.concatenate([combinacoes_b, combinacoes_c])))
+    return combinacoes_b, combinacoes_c, "\n".join(linhas)
+
+
+def exibir_em_colunas(linhas: List[str]):
+    """
+    Distribui as linhas em 3 colunas, na ordem em que aparecem.
+
+    Cada coluna recebe um único elemento com todas as suas linhas, em vez de
+    um elemento do Streamlit por jogo. Como as linhas são unidas em um só
+    markdown, use apenas para textos gerados aqui, como os números dos jogos:
+    os jogos tipo A, que trazem o nome digitado pelo usuário, continuam com um
+    elemento cada.
+
+    Args:
+        linhas (List[str]): Textos a exibir, um por jogo
+    """
+    for i, coluna in enumerate(st.columns(3)):
+        if linhas[i::3]:
+            coluna.write("\n\n".join(linhas[i::3]))
+
+
 # Configuração da Interface Streamlit
 st.set_page_config(page_title="Gerador Mega-Sena", page_icon="🎲")
 st.title("🎲 Gerador de Combinações Mega-Sena")
@@ -312,6 +785,10 @@ if "multiplicador" not in st.session_state:
     st.session_state["multiplicador"] = None
 if "mensagem_sucesso" not in st.session_state:
     st.session_state["mensagem_sucesso"] = False
+if "rng" not in st.session_state:
+    st.session_state["rng"] = np.random.default_rng()  # Um gerador por sessão
+if "semente" not in st.session_state:
+    st.session_state["semente"] = int(st.session_state.rng.integers(2**32))
 
 # Campo para entrada de dados
 conteudo_colado = st.text_area(
@@ -326,6 +803,7 @@ if st.button("🔄 Processar Dados"):
         jogos_referencia = processar_dados_entrada(conteudo_colado)
         st.session_state.jogos_referencia = jogos_referencia
         st.session_state.mensagem_sucesso = False
+        st.session_state.semente = int(st.session_state.rng.integers(2**32))  # Novos dados, novas combinações
         st.success(f"✅ {len(jogos_referencia)} jogos processados com sucesso!")
     except ValueError as e:
         st.error(f"❌ Erro ao processar dados: {e}")
@@ -358,22 +836,27 @@ if st.session_state.jogos_referencia:
 if st.session_state.jogos_referencia and st.session_state["multiplicador"]:
     multiplicador_valor = st.session_state["multiplicador"]
     jogos_referencia = st.session_state.jogos_referencia
-    gerador = GeradorJogos()  # Cria instância única do gerador
 
     total_jogos = len(jogos_referencia) * multiplicador_valor
-    num_jogos_b = int(total_jogos * 0.75) - len(jogos_referencia)
-    num_jogos_c = total_jogos - len(jogos_referencia) - num_jogos_b
+    num_jogos_b, num_jogos_c = quantidades_por_tipo(len(jogos_referencia), multiplicador_valor)
 
-    # Gera as combinações usando o mesmo gerador para garantir unicidade global
-    combinacoes_a = gerar_combinacoes_tipo_a(jogos_referencia, gerador)
-    combinacoes_b = gerar_combinacoes_tipo_b(jogos_referencia, num_jogos_b, gerador)
-    combinacoes_c = gerar_combinacoes_tipo_c(jogos_referencia, num_jogos_c, gerador)
+    combinacoes_b, combinacoes_c, file_content = selecionar_combinacoes(
+        tuple(tuple(jogo.numeros) for jogo in jogos_referencia),
+        multiplicador_valor,
+        st.session_state["semente"],
+    )
+    combinacoes_a = jogos_referencia
+
+    if len(combinacoes_b) < num_jogos_b:
+        st.warning(f"⚠️ Não foi possível gerar mais combinações únicas do tipo B. Geradas {len(combinacoes_b)} de {num_jogos_b}.")
+    if len(combinacoes_c) < num_jogos_c:
+        st.warning(f"⚠️ Não foi possível gerar mais combinações únicas do tipo C. Geradas {len(combinacoes_c)} de {num_jogos_c}.")
 
     # Verifica o total de jogos gerados
-    todos_jogos = combinacoes_a + combinacoes_b + combinacoes_c
+    total_gerados = len(combinacoes_a) + len(combinacoes_b) + len(combinacoes_c)
     
-    if len(todos_jogos) < total_jogos:
-        st.warning(f"⚠️ Foram gerados {len(todos_jogos)} jogos únicos dos {total_jogos} solicitados.")
+    if total_gerados < total_jogos:
+        st.warning(f"⚠️ Foram gerados {total_gerados} jogos únicos dos {total_jogos} solicitados.")
     
     # Exibe as combinações do Tipo A
     st.subheader("🎯 Jogos Tipo A (Originais)")
@@ -381,36 +864,22 @@ if st.session_state.jogos_referencia and st.session_state["multiplicador"]:
     col1, col2, col3 = st.columns(3)
     for i, jogo in enumerate(combinacoes_a):
         with [col1, col2, col3][i % 3]:
-            st.write(f"{jogo.nome}: " + " ".join(map(lambda x: f"{x:02}", jogo.numeros)))
+            st.write(f"{jogo.nome}: {jogo.formatado}")
 
     # Exibe as combinações do Tipo B
     st.subheader("🎯 Jogos Tipo B (75%)")
     st.markdown("Combinações geradas com base nos jogos de referência.")
-    col1, col2, col3 = st.columns(3)
-    for i, jogo in enumerate(combinacoes_b):
-        with [col1, col2, col3][i % 3]:
-            st.write(" ".join(map(lambda x: f"{x:02}", jogo.numeros)))
+    exibir_em_colunas(formatar_combinacoes(combinacoes_b).splitlines())
 
     # Exibe as combinações do Tipo C
     st.subheader("🎯 Jogos Tipo C (25%)")
     st.markdown("Combinações exploratórias com novos números.")
-    col1, col2, col3 = st.columns(3)
-    for i, jogo in enumerate(combinacoes_c):
-        with [col1, col2, col3][i % 3]:
-            st.write(" ".join(map(lambda x: f"{x:02}", jogo.numeros)))
+    exibir_em_colunas(formatar_combinacoes(combinacoes_c).splitlines())
 
     # Exibe o custo total
-    total_custo = len(todos_jogos) * 5
+    total_custo = total_gerados * 5
     st.markdown(f"**💰 Custo Total da Aposta: R$ {total_custo},00**")
 
-    # Gera arquivo com todos os jogos
-    all_games = []
-    for jogo in todos_jogos:
-        all_games.append(" ".join(map(lambda x: f"{x:02}", jogo.numeros)))
-
-    # Cria o conteúdo do arquivo
-    file_content = "\n".join(all_games)
-
     # Botão de download
     st.download_button(
         label="📥 Baixar Todos os Jogos",
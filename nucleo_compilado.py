@@ -0,0 +1,143 @@
+"""
+Núcleo compilado do Gerador Mega-Sena
+=====================================
+
+Este módulo reúne as rotinas aceleradas com Numba usadas pelo gerador. O Numba
+é opcional: quando não está instalado, `NUMBA_DISPONIVEL` é False, as rotinas
+ficam como None e o gerador usa o caminho vetorizado com NumPy.
+
+As rotinas ficam fora do script principal porque o Streamlit reexecuta o
+script a cada interação. Importado uma única vez, este módulo mantém as
+funções já compiladas entre as execuções, e o cache em disco do Numba
+(`cache=True`) evita recompilar ao reiniciar o servidor.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_DISPONIVEL = True
+except ImportError:
+    NUMBA_DISPONIVEL = False
+
+
+if NUMBA_DISPONIVEL:
+
+    @njit(cache=True)
+    def mascara_valida(numeros, dezenas, terminacoes):
+        """
+        Valida a distribuição de um jogo e calcula sua máscara de bits.
+
+        Interrompe no primeiro número que estoura algum limite: repetição,
+        mais de 4 baixos ou de 4 altos, 4 na dezena ou 3 na terminação.
+
+        Args:
+            numeros (np.ndarray): Os 6 números do jogo, em qualquer ordem
+            dezenas (np.ndarray): Vetor de 7 posições usado como rascunho
+            terminacoes (np.ndarray): Vetor de 10 posições usado como rascunho
+
+        Returns:
+            int: Máscara do jogo, ou 0 se ele não respeita as regras
+        """
+        dezenas[:] = 0
+        terminacoes[:] = 0
+        mascara = np.int64(0)
+        baixos = 0
+        for i in range(6):
+            n = numeros[i]
+            bit = np.int64(1) << n
+            if mascara & bit:
+                return 0
+            mascara |= bit
+            if n <= 30:
+                baixos += 1
+            dezenas[n // 10] += 1
+            terminacoes[n % 10] += 1
+            if (
+                baixos > 4
+                or i + 1 - baixos > 4
+                or dezenas[n // 10] > 3
+                or terminacoes[n % 10] > 2
+            ):
+                return 0
+        if baixos < 2:
+            return 0
+        return mascara
+
+    @njit(cache=True)
+    def sortear_aceitos(base, novos, minimo_base, maximo_base, acumulado, quantidade, vistos, semente, max_tentativas):
+        """
+        Núcleo compilado do sorteio por rejeição.
+
+        Sorteia cada candidato com um Fisher-Yates parcial sobre cópias de
+        `base` e `novos`, valida a distribuição e descarta máscaras já vistas.
+
+        Args:
+            base (np.ndarray): Números de onde sai a base de cada jogo
+            novos (np.ndarray): Números usados para completar o jogo
+            minimo_base (int): Mínimo de números retirados da base
+            maximo_base (int): Máximo de números retirados da base
+            acumulado (np.ndarray): Probabilidades acumuladas de cada quantidade
+                de números da base, de `minimo_base` a `maximo_base`
+            quantidade (int): Quantidade de jogos desejados
+            vistos (np.ndarray): Máscaras dos jogos que já existem
+            semente (int): Semente do gerador aleatório do Numba
+            max_tentativas (int): Número máximo de candidatos sorteados
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Jogos aceitos (ordenados) e suas máscaras
+        """
+        np.random.seed(semente)
+        sorteio_base = base.copy()
+        sorteio_novos = novos.copy()
+        total_base = len(sorteio_base)
+        total_novos = len(sorteio_novos)
+
+        conhecidas = set()
+        for mascara in vistos:
+            conhecidas.add(mascara)
+
+        aceitos = np.empty((quantidade, 6), dtype=np.int8)
+        mascaras = np.empty(quantidade, dtype=np.int64)
+        numeros = np.empty(6, dtype=np.int64)
+        dezenas = np.zeros(7, dtype=np.int64)
+        terminacoes = np.zeros(10, dtype=np.int64)
+
+        total = 0
+        tentativas = 0
+        while total < quantidade and tentativas < max_tentativas:
+            tentativas += 1
+            k = minimo_base
+            if maximo_base > minimo_base:
+                k = minimo_base + np.searchsorted(acumulado, np.random.random(), side="right")
+                k = min(k, maximo_base)
+            for i in range(k):
+                j = i + np.random.randint(total_base - i)
+                sorteio_base[i], sorteio_base[j] = sorteio_base[j], sorteio_base[i]
+                numeros[i] = sorteio_base[i]
+            for i in range(6 - k):
+                j = i + np.random.randint(total_novos - i)
+                sorteio_novos[i], sorteio_novos[j] = sorteio_novos[j], sorteio_novos[i]
+                numeros[k + i] = sorteio_novos[i]
+
+            mascara = mascara_valida(numeros, dezenas, terminacoes)
+            if mascara == 0 or mascara in conhecidas:
+                continue
+
+            conhecidas.add(mascara)
+            # Ordenação por inserção direto na linha de saída: com 6 números
+            # ela evita a alocação que np.sort faria a cada jogo aceito.
+            for i in range(6):
+                n = numeros[i]
+                j = i
+                while j > 0 and aceitos[total, j - 1] > n:
+                    aceitos[total, j] = aceitos[total, j - 1]
+                    j -= 1
+                aceitos[total, j] = n
+            mascaras[total] = mascara
+            total += 1
+        return aceitos[:total], mascaras[:total]
+
+else:
+    mascara_valida = None
+    sortear_aceitos = None